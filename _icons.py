@@ -0,0 +1,9 @@
+# Generated by tools/embed_icons.py from images/*.png — do not edit by hand.
+
+ICON_B64 = {
+    "calendar": "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAABmJLR0QA/wD/AP+gvaeTAAAEh0lEQVR4nO2bS2wbVRSGvzMOTUMbkLpAUDshxA6q1Aq2rHmqrURaIbEBIcUuohBRYIOUDaR7RCSehchOSbsKiqqWBhbNmjWiiiCKE4XaMQiJSiQNiVPPHBaJxLzsxLXH4xB/u3vvf6V/zpy5vud6Blq0aLGXkWrEveOFbjHNflHjpKI9AjHgQEDedsqqQl6QRYXrwNX5ZDS308k7CsDj3+SiasoHCikgcq9OG4QFTLZJ5P1fBx5Z3E68bQDiY4VTotYl4GAdzDWSFVRezaai1yqJjEqDfWO5d0StSXbfxQN0InqlL5M7V0lUNgO27vwk3iDdFNG0ijV9v9G++PNrD6/Ww+298sT4Hwf+sYo9osazqnIGOOaSWKicLpcJvgFIjOZjRPgF550vAu9lb0W/YlisurivN8NqJB4tnEV1BNhnG1mJqHVkNtVdcE/xfwQieh7XxatyPJuMfdm0Fw8wLFZ2IPqFwnFgwzbSaUrkvN8UTwb0jhe6jZK1gG21F+XNuVTsQt0NB0givTSI6Ge2LhOTnuzrsbxd58kAMc1+nD91N+dy0a8D8hkY2c7DF0BmbF0RDOl367wBsIwTjrZouqnTvhwviwmatneJ6Am3zGcN0F5HS9tu1Ntbo1DLcni3IO7WeAMgHLY329cit+rurEG0Scdv9rZA1KPxmefY9BQ7NlYSmbyPrPkxKbq7PBu6ijvBvUArAGEbCBu/NcBBNhmr6syg2Uhk8lppfM9nQCsAYRsIm1YAwjYQNq0AhG0gbLbdB+yEeGapS0RHUJ4HEGTaUIZmU9HZMPTVUHMGxDNLXYL+hPIS0Al0KnraFP0xMZqPNVpfLTUHQERHgEM+Q4eI8HGj9dVS+xqwlZZlBl9ouL5KAl4EpeI+vPF6L7U/Ash0hUHPWND6aqk5AIYyBNz2GbptoUON1ldLzQGYTUVnMXkS+BZ0GXQZYdISfWphoGuu0fpq8dT67vr5/3Ye4L6ePb8TbAUgbANhsytqgSBp+logaJq+Fgia5q8FAmaX1wK10/S1QNA0fS0QNE1fCwSNXy2wgu1/9Pa1fZ0zgw/daairOpG4/NcDbKz9/V+PLmeTXQ/aNd4MUBzv0hU7zO6A/AWOrq86vCvyu1vj8wjIgqMlpefqbaxRiGE4vBsw79Z4AqDClKOtcoYJbfY3xL1MaAQkZe9SkSm3zG8RvAqYtvaxxGrhjTrbC5z4av4t0KO2rhIl9bwv7AnAfDKaQ/Sio1N1JJ7JP113lwHRezH/jKh8ZO8TyLjfEoUyP4OGwYfAiq1rn8APifTSYFM/DhMaiY/l3jYsvsfxsrQut90tDftNKXvclUgvvYjoFTxBkhnQtFrWjf3F/Yth/0Qe/fzPg+vt6z2bC56kXGkPYCFyKjsQ/c5vfsXzvr5M7pwiI+zegxNLRd+dH+j6tJxg2wPPrUy4zGbtvovQZUFemUvGrldSbXtnN7+0iMQV+QQo1c1fcFgol+67ax7Z7uKhys/mEqP5GIb0I3oSeIzNz+bC/p7oDpAXWFCRKUp6zW+1b9GiRQs//gWOXyDqVUR+8gAAAABJRU5ErkJggg==",
+    "folder-library": "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAABmJLR0QA/wD/AP+gvaeTAAAHDElEQVR4nO2aXWxcVxHHf3P3IxZ24pQqTWOv0zR7XatZFLWi4kMUUdQiHlrUpG0clRgntnFMArxUFRCewgtRP/iQCgHnYzeJ4kpxKaRSg5BaiTwgVUBBJcIlTdYOtXcTF1TSxOsk6929w0O87r13vd2Nfe/GAv+fPHPmnJkzPnNm7s6BRSxiEYtYxCIW8f8KqUYoNjgUvpZZvtFQ3WAJ9wpEgPoK03LAmKicKITk+ZHOptF5W+sDKjrAjKeeAJ4B1s5DTwakI9nd/Mo81vAF5R0wqAFzIv0swlMe6cor0jHc3XzMo/U8gVFuwOPNAwQFHTDjYx0erjlvzHoCpo/9Sy52VpH+gGUN1IVDQ6c6b5/8qIXXHxmvnyzkukXlx0DQNrSgTkKJA2KDQ+Hs5LLTqNxpY6cKBX34XG/LqRtVEI2nNwt6lAXqhJIQuDa5/DHX5q/NdfMAw93NxxTpAPI2dlDQo9F4evNc1vQSJQ4wLH3UTiv0z3XzRSxkJ5SEgBlPnQFai7Ql1qdGulb/2QtlZcLBK0wqpED/KirHlyy9dHyoPTZVadJsWWCVnWgIhN/2ysIyJ8Er1Au0CfIkwrFspvHt1sTYY5UmOR2gKkCDnVPptl/AiKrKy63xsefYrWXTfdkBP2AmUpt8DIFZocjT0dWpPeXGa2ZINJ7ejPqXDtcfGa+/ms99AjW2qOh2YElxTJDvRBPn3xjuajrunue8BFXFTKQtOyfZHZn3Kal1LdCaSN2jyqtAs42dXNJwKea+GH0PgZtRCJ3tirwlwiNA1sY2s5ONj7plfXPA+iPj9dHE2LdvVhV4tivyFuh+J1dKHFDpDhAzntK5GHAln0dKy4zalsAiAyjfKpKqep9bpJZZoIDqtlrW/0uuhP9up8V5JwC1c8AEyOPJnpaBGukDYOibt2VcrAa3jJ9pcAp4V+G3UuD5ZG9zykddc4bTASKarPJ3wv8V1LQSXIhYdMDNNuBmIwjQdjDdZgl7FH0IWOqS+QB4ffrvh4DlrvEJhdc0wK6RrZEz/prrPaTtYLqtIPoGcMs817poBfjMQnOCu5BLdkccl7xhCXuY/+YBbpECZT87FyqM6WPvCcTDtWqFIK6Ydx+RSkfIOS7L3ArM+IUVauhqsWQ02b3q3x7Y7Cn8qQQHNWBOnH8YYScUviQWBmCZidRvggZ9p7dG3vdF7xzgeRo046ldZiY9jOgroF+26TBQHs8XOMGgBrzWO1f4UQf8ELjjI8Y/3Zo53+6D3jmhVoWQ68jrzhrprQg/HZAFXlLkc1IwPg/MXJYK95sH0vf6qLtq+PU5fK1QCK0517vyvSLDjKdOAl8s0mpoH/ANn/RXDb9OQF0wOPWgi7fXTghsWds/3OiT/qrhXwio7LCTkdHm40DaxmqQUN3XfNNfJXxzgDvOT+6WPKoH7DKC7pxux900+JoFpuN8BqF8oZ/rr8eKuNs8lPqCX/rNo++7KlO97Jbx1QHuOP9H35oLgPOlmCtUPEXu6jqHKuSCW8QPBzjjPBzudBihzssQ2Hh3/z9X4QdUt9hJEXnTLeK9A0Qc3RhR2WGP8+GeyO8B++/1oVwo1Ou1Ga2J1D0g2x1M1ZLmqOcOCE3l9uGK82g8/YDDDtF9zlna98n+N0Ne2WBrjoZt7GRjbrzkoabnDpiOc4enRXCUvkGr7hAwYWM1XQ6v/Mp89MZ+/q8G82Dqs2Z87AVV/khJF0ie/kvffTn3PH8qQdG9qGyycTbcdXis+czWljTAOz0rJqLx1IsCH2YJS3YCvy6SscGhcDbTOAqsrEZllmLXe7asKs+Ue6brSxZIdrWcxBnnQSuPI87FKLxgp1V40Dz0bqxID7XHpgQcdcNcoOizydGm75cb97EQkn4Hbch2e5wnt90xJPAHh4wVcDipEDT2AYU5mpAE2TDc3fJddotVTsg3BwQ1fNheeIiy6lL49g0OIdFfOEjYtv7I+Mwz/JHOplEVflelygxwGpEBYFNjbnxdNa/TfWuOvtOzYiKaSL0oavviU3Zge4Mcrr/8q2ym8SfAbdOsxiv53JPYjv5wV+QRv2wEnytBK+/8DwMPmPELM9XZUHtsCnXHuXzVT5vc8NUB53pbTrniXCA/U/quSZyrQ3D38Ff7aZMbNXgmJ3tB77cxOu/cP7bfCNIhKt3ArQ5xlbP+2/QhglwvSGZ6A5XeBFUYv+RmhBs+eDmbaXyPmXwuywIB/sbsq6io/qyi1R7CUHjNs9Vkpok6g+txrr+sYnYW5amzX4+c8MyeKmBogF3ARQ/Wumihu2Yb+Fgo9BzOwsiO/wA/MiisS/ZEfuqBHTcEAVh7OHWXFNhzvbdX0t66iLM97mqk6mVFXlfR7410tZSN39iBsY9nDX4AshG4FZE/iaWJq0v1WKq95apnO7pB/Bdy7psXEkafwAAAAABJRU5ErkJggg==",
+    "mail": "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAABmJLR0QA/wD/AP+gvaeTAAAFI0lEQVR4nO2aX2xTVRzHP7/b2Y1AGZBgxLWDuA5iiv+iCfiiRMcLD/qgW+Ib7SZgokREM2NUMDHCEv8hD4psHTHwsmlMjImRjAhv8EAUsYbBXWS0NSQEDGzTbqz9+UA13e3dbrfddk7uJ9nDPfd7Tr7nt3PO755zCh4eHh4eHh4eHh4etyPiJGjovLQWw2gTpAl0FbCw/LZmxQjIRUX7yOU6B9rqf5lKPGkAIj0J/+hQ7UcI2wDDdZuVIQv6afWiGzsTLZExO4FtACI9Cf/ocO13wBNltVchRDnmD1zfZBcE2//s6FDtR/xPOg+gwpNjQ0vet3tXNAIaOi+tFcP4CfAVFCdFdYdBzdH+1uVD5TLqBmu6rgTGyTQJshdhdcGrLEb2AXPzykShvqqoBcNow9L56pw+mGgLXSuPZXfJ/4O+jnQmT4yKnAGC+Vc+cr5W4JVCfdEUEHTjhGfVHfOl84Uk2kLXkImdBTZadTZrgIQmCmqOuuqsktyx4HtLyUqrxG4RDBQ+jAQy4256qiQZ/583LUUBq8Yxv9cMy4WGeGrLht1avF78V9mtRrg71Vw9LL86SUv5wKkTOJCqT58Nd6eaUXX8epxLVsfTTY2h9I8oPQKrnPRFnQnHU+pQ5xRouxkLnZipyXIQ7k6tB+lA9bGpdGYsOKHPMxnW60CON8RTfT7l1fOtwTMzaMM1Gg/+fq/6cu+gPAvTH50lTAGNA1lrqUBTTjgdjqfiDfF0yKZiWWmIp0PheCquvtxZoJni0ZzNe58SxwCYsVCrIcZaoBewTg8fEBXUbIynDjR8cfnOEv3PmPojg0vD8fReQfuBKBM/2uCWyT5DediMhVqd2itpCpyP3n0OaAl3p9aj7AUet0j8CltkfPy5cFfyw0yAjlRL6K9S2i6VSE/CPzay+AUdlV2gSyeRnQJtH5jG+jStba4ZDZ40Y8ENBrJRlJ9tJAFEdrmaOvMpLTNc268qHwN2nT+H0GJG6x6d7uI8o33++Vhd34Vk3UMILQoXbSSupM4SUlpaYWvwUt19ZjTYi4hTBivCMQ1a04aVSE/Cnxmu3SzwLrB8EtkpRF83o6HjpZgqIaX9gWhHZiGfOE01p/7MeojmDxk+rz8y2OsfrWoH3Q4ssMjWofKDU+osSGnNxestAGMChxTfm2Z0xZXZegcXRkBR/YOpoPh4SyGGfYBzwFe+bFV7//N3/Wap04rNqm5Xp2Q/Dv1xPQD/tnNoMELO9x7w1CSSjIruBxCVl4CaSXTfYGTfsB5klOyj3FNgMvKGn54iddaIymtTNFGRT+6y7/DMaPAksGF1PN2kqh+ocL9DlXMIb5ub676cyao+XSp23F1C6px1SpsJld3j75acCb3BnuS3NSNsV5VtACL62T8pbaCihiodgDz53N2R/5tT5uuNj2t4AZhrA3ONF4C5NjDX2AVgwt3fmq4rRWfp84V7DgzUWoqK7jVtAqDJwqdxMk2uuqogviq/1fugVVMcAJGjluc9kc7kMledVYBIZ3KZiuyZUKgUXfPZBCDbScEpsMCaUUPOhLtTzeHDVxeXwaurhA9fXdzYlXxm1JCTQGPBqyzi67Lqbbe64XhyP8iL5TI5FyjsG4gFX7aW22aB6kU3dopyrPy2KoNC35Kbl2233rYBSLRExvyB65tEZT82lyLziHGFfUtuXt50eusj1ptioISfyeVPdlq59eOCVcAidz26zjBwEeUo4usyYyscb4g9PDw8PDw8PDw8PG4//ga8d+tVp6qH9AAAAABJRU5ErkJggg==",
+    "mail-read": "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAABmJLR0QA/wD/AP+gvaeTAAAGbUlEQVR4nO2abWxTVRjH/89tN0AYbwYZrB3I7oZJFTVgxGSRqdMPoPIBGRITQltefEGCylhCRBYiL5OgIh8At94SAlGHfCHED2QQNL5AAhqQGbbdDUZvxxSJGWxhL+19/LAW19vbl7W3LcT+kn7oOc8993/+Oc957j0tkCVLlv8zlImbFh3sfEjw+VYx8DwAMHASZnNt67L8v9KtJa0GzKztfNhn8q8j8AoAD2i6+8CoN4G2NjkLmtKlKS0GFLuVJ1jF+yAsBWCOEa4C+A6ErbLdcibV2lJqwAxXR6lAahWAlxMagPETBKqRl089DiI2Vt0ghhswe/+5nK6cyUuIqZIJs6KEthPxZwDATO8BmBYl9gKYd1o8lm9OV5PPSL2GGTDrYOfoHp/vDQLWAyiOeEPGRRXYNd7X+dX51XMGAADVLIjTOhYQ8yYGnopym3YQ71X7+/e1rS7qMkJ30gaI0vVJYN87IFoD4MGIgXEu5/jShm8xhANm9tc0OQs7kpCfuAExdvQgCW9ocW6cSVeOYRuQLmFBUm103Aake2lqMTrVgkQ3gJmK3B0VAvPGeHb0UaacuovL8nti3TQZZh3sHH3HP7AiVuUgxkWVaFurfWp9NCMiGjDdfSXfzDlfA5gXRU/KylMsyqrZrFiVJSCqBPB4lNDTfn/O61dWTv5Tr1PXgMHl5v8RhJIIg54C1E9ku/VEqh5Q4oaZRLfnJUDYgMC7RVgI0GQaEEqbV0/9W9sXwQDlGIBXNM1+AEdVVne2OQvPJas7FcxwXZsjkFAJYBEAk6b7mOywLNReE2ZAkUt5jginhrYx0MDEb7fZrS2GKk4RM9yeYpNKe5nwwtB2UtV5LSsKfxjaJmgvJsCuafp55JiuBffL5AGgzW5tyc3rmg/gl5AOQXBoY8MMgMCloQ3qlsYKW7+hCtNAY4Wtn4m3DG1joFQbF24AU4EmpE50eZ2oZ21O3bvUs0l0eZ3EVKvpsWhDww0AcsMuIq4Tu72XRLeyGMwZOUWKlxLJW1582/sriOsQPuER2viwyYiSEqusnQW4SnZYv09Cp+GIbmUuQDVgfjZanOywhMw51umMHk8DdLpIUhpMjPXNTsuFBMYwjBJ3xyMqq1vAeA0Y/urUSwENLGHwGSAEAspVwnlRUqQiyWsd7o2TpUjyWkVJkVRWLwFYjPDV7A9oj0pMA2SH1SmQ8CiAIwC06WECYCewXCwp+0Xp+qQ49SdM4eH2CaLk3UHgJgyW7LDNmYEGgTFbdlidscaLKwWa7VMvA6gQ3cpcMHYg/P0gl4FVgH+p6PJ82puHGqXCeieesePFVt+Y298z9i3uo80AT4gQdhbgqtZh7E9xpMB/yHbLGdlhKRNALxLjok5IHog2j+ymliJJWVVWzYnsMaFUsyC6lcW93eOamOlzAHqTvwxChWwveGa4m/OwDAjS7ChoaPEUPAlCBQNXdUIKCNivFHp/T6Z0lkje8mKr9zcw6gmYrhPiZWC15VrBY7LdciSRF7OYZVBbNrTY6htze7vHLSfgYwCR9oBhlc4oqRbkHxDX9I7GF7FSLdZ8kl6igcfkLwsPtx/J7TNXAbwWwChNWFylM7Sk6b6p9hNwgGH6ULZPuZGsdujdZLgrIOz6WsVCJmxiwAF9g1UAR01+c1XTyvwriV4Tt54Y8zHcgLvjHGi3QTVtA/BqhJA7DN4zKILeRfiqCXIMgn+jvHxaY0I6Up0CkQgIXhgln0cRaEOUIdLyyJ0yA4IEjqnLSiRvOTPvinG4CgyWtI/k5QXfpuO4LaEymAhxlM6kS1oipHwFhFBNqgwcsdR7jo/swVpmehMAiHhfsKS1plVQug0IEKjdNYFPRklbCtyrZA3ItIBMkzUg0wIyjZ4Bt4d+mem6kZcmLYYzY3/rOE3TbW2MjgHsGfrNh95yQ1WlEZM5V6u9XRsTbgDRCc337bY6z0RDlaUBW51nIhNtD2lknNDG6Rjgr8OQU2ACZvYJdEF0K4vFQzfHpkCroYiHbo4tdnkW9Ql0BqH/VvODTC5tfISfxz17AFqTKpGZgIHdrQ7LOm27bhUYMebWB8Q4mXpZ6YGBhvEDnZV6fboGNFbY+nPzuuYT0x7o/ChyH+FjYPf4gc75d/+UqSHmaU/gZMcJ4EUMnsyOMVaj4XQDuArGCZDJJTum/JFpQVmyZMmSJUuWLFmyZLn3+BeOGLN5GipKKgAAAABJRU5ErkJggg==",
+    "mcp-server": "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAACXBIWXMAAB2HAAAdhwGP5fFlAAAAGXRFWHRTb2Z0d2FyZQB3d3cuaW5rc2NhcGUub3Jnm+48GgAACZdJREFUeJztm21sZFUZx3/n3Jd573SmhdndttvuboFlYXG7QAJBwCghJJhojCshgBqiIGhiIonxGyZK9BuJStCQqF/UAMb9YAghrhgMEiEYYEVhYUFkX/q6bWfaaWfu2/HDvN2ZudPOdG9bEP4fpvfe89znnv/zcs5zz7kVSik+ypDb3YHtxscG2O4ObDc+8gbQN0OpEAjue6p/M3T3hNzLefXgg95aIiLsWUD7+jPfFPADIBOq4o1hUaEedB+75SedBEI1gLj76QOaJv/JByu1lIY6VH7sluNBjaF2VJPyUNg6Q4BwBYc7NYbcWWGEqy8sdO7XB81bW46PDbDdHdhuhFsHGLqnkGUg0vUthsSM9dYNqUtMo0vfCWwEHWuBUA3gZnIS1T15gGhSsnN8sKfnpNIRhvb2dStuiDUi/cOZAiI8VeGmQKmg92pTpQu8UgwZiYHYen8EGmDXQ2+MumiHJUoHcP2Nbru89dZz+wDiZvJq14g3GlTTH/wNylM4joM0Bv7lleKXKbuMlspukMbG0WaA3EMn7hBovxIKw6vGmkA1yNTCz8fKvOhGFIp6tdFK3CerfLq8UgHrxFMpJ30d+sAQyrUR2tbWUm0xJ5T4kVIYqtpdlGompGgmpKqkfG0qUFahfLoAZKQPLbu/v3z6REPZFqPNAApG6p3x8woi7r/Y0UgV4k3cfHYVkYTuWaWQ6PSOgDEgwOP+1taLHcNdtTs0SHab12TbDaCCyNSud0O8Oc87y1bO1lyt2AK0GWBdr/v+aBIO5qJcmougS8H0ks1/5m3emi03KQwiXjsUnmeGQ2VjCIyA+mGHcDd0wf3XZLnnmgwXJttVHJ8s8cjz53jyeKHlXuXTW7++Kcty3SL44WuE+wVJnSfuGObgzmhHpVfsjPKLI0NcOxbnu3+cxvG8hpqa2uqJsm2Wi2WsmRVkMQKavW6nbcvFjGrrylUglAKDi+OBre0poIKJA5hS8Jvbm8n/4/QqR18vMLfsMpTWueuqDGOZylz+1aszTC85/PjZ2ZYxQTWmSw+KBYvizArETOiiDrBKDobZrQEQCGFDlwZodLJ9gPvyVf0cHmqQ/+GxWR7+61yT7M/+Ns8vbxvi1ktTAHznxkH+cLxQGRdqXg8uFLYF7cW3r5ipn1cP7jycros9/eYSDz83h2qRtR2Pe588w2zRAcDQBLdPpGuFA8qjfvwB4B9YCLU5R6EYy5hcvqPh/UdfmG+ZzxW1kaNY9nj8lXxd9rOX9TUKpzrxqkE2g1UP6BgBtZNa+Xog13jNLzuKF99fbSPuLwz//l6xLj+aMZD+GrlaGdajYZPh2Vavi6Lt5WvON93NLDvYToNtU5lcJThVcOryhibIxvSG130RsBUhkD/2p+/H9997JKitPQU61O3StwihS0GT16tyfoKtioslNzgNtsACyrYvEIgnEvvve6y1rfMKRMtg6PfoYEIjZkif1xvElVLgKYb7G1FXKLmsWF7zwFeXP3+C68KtLGJo2YEvtDYFG8A/QFc7+++ZxhuboQlu2JuotHk+Ij6CN+xL1OVfem+l2eueapbfLDgOpXffwZqZwdwzvpy865626i2gEPKf1H84OWvx6pkSh6p1wAOfGuSZNwp4NRlfNAynDW473NgcPvraYl1xnXhDdfhQYE9PUXr3HZSniN1066oTzyZtq/3Vq2MEtI3uwCPPn6uLXDUS4+dHhkgYosmzo1mT339trJIiwFTB5uiri4FRUrunZ36O07HNXVhg+eWXWDlxAi+Tw75oAjuejXV6SsDLUNVT9Z/G9d+/usitB1J8/mBlSfpLE/3cdEmKP59YYn7FZU/W5NOXJKuDJLie4v7fnWK55DWHuy8ahFNCLkwjz56ESArk+u9GZeDt6VzTNWGVkfNnYXWJ+MhuZYwfEkrT142y9V+HqxdqA/a9j59iubSLO6+ubP9n4xpHJtq/hVgquXzjt6c49kahocefBtW0EcoDM4KKJiCa7MoAyirhJirPF66DnDuDWJjGzPYTu3ICFU2KbuOq8+twC/Fah8s2fOvJ0xx9Lc/d12a5eX8KQ2vMkZMFm6OvLPLTv8xwZtFu8rpqiYDzK4UVcmEabe4MesQg+YmDqP7BxqJtl+hgANUY1zqE7rE3lzj2ZgEJ5JIGfTHJqQWLYrk93P2zCS3HXs9LQgqxuoTxznGkckiM70HmhlByY3sKgWNAIw2a58PWaADwlOJs3uJsnkCC7aO+qhdXlQMPUTiHsEqo6NrbXaJcQi5OI0rLxC+/Am14DLTzW0/pMA0GEK81BkRDR+IB97RGg54ZQC9mKM2eRpbLeAPDKL25dBeOjcjPIYt5IkO7MPd/EiLB7/e9ouMs4F+06OzZ6sV187xDGqAQEmJ7Rhm45HoWjr9NafJdvFQWLz2IqEaHLCygZ9LEJq6HvnB3j4IM8D6wu43gOtGwVp4HRVXdbu4qaKD3pdhxy2coT84x88KLuGdPghLIiEZi4grIjYDsehWoa7SngKe+hxC/RimTFrJrRkMQwXWiQbjLGNZJRDRVf350ZBfDX/wcxf+epjQzjepLo6IpsMsI3ahMkyK87eHAz+QGHnh9xBbqSqlcA+rvEs3wXdPnnn0i8K1GNZ8o3zWhLIQzh5HqR8/kiB+4Di2ZQeiNVXLXsimcncRaXkYYEUQkCVIiNHPDg9/st8earBfKd4K5rzyket7iEAItmkDG+5DxNJGRS9HTFwR6t7y0xNLkFK7tIMw4wohVDKGbPadFqwFCWZM3hy8+r28WZCSOluzvGNqRVIpIIklxfp7izCyeXapEg1IgtYohNpgWoRhAS2Y2bgCpYebGmkI/WE6QGBwglu5jeXqG1XweNAMRSaGUW9lW38DWejgRsGPvxhwgJNKM9hTG0jDoGx4imulnaXIKpziPMGNgJsB1ek6LUAwgY0lEiCNzNzATCQbG97G6mGd5cgpvpYwwE760MLr65GZb9+XCQKw/TSSVpDgzy8r8AtirlbTwXND0Smqs4ZwP51diLZCaRmrnDrJ792BETLyVBVSpAI6FslfBC5rHq/duYT83HUYsSmbvGP2jI0g8vOI8ylpF2WWUFWyIUFJAqVCLs/NGJJXCvChBcXaOlXPn8KxVRCRZ+dirBaFEgOt4K2HoCRNCSpK5C8mO7yOSjKNW82iUp1rlwkkBz7rZttzyFuxx9AzdNOnfPUJqZPeKEfNubm0P9V9mRh/NZyIxazQ0hSFBJfJn3j4yPhvUFvo/TX3Y8H81C2wEHxtguzuw3fjIG+B/u5z9FUTeHA4AAAAASUVORK5CYII=",
+}
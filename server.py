@@ -11,29 +11,32 @@ Usage:
 """
 
 import re
-import hashlib
+import zlib
 import html as html_mod
-import base64
-import os
+import functools
+import heapq
+import threading
 import pythoncom
 import win32com.client
-from collections import OrderedDict
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from itertools import islice
 from fastmcp import FastMCP
 from mcp.types import Icon
+from _icons import ICON_B64
 
-def _load_icon(filename: str) -> Icon:
-    icons_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images")
-    with open(os.path.join(icons_dir, filename), "rb") as f:
-        b64 = base64.b64encode(f.read()).decode()
-    return Icon(src=f"data:image/png;base64,{b64}", mimeType="image/png")
+def _load_icon(name: str) -> Icon:
+    """Build an Icon from the base64 PNG embedded in _icons.py (no file I/O)."""
+    return Icon(src=f"data:image/png;base64,{ICON_B64[name]}", mimeType="image/png")
 
-_icon_server = _load_icon("mcp-server.png")
-_icon_list_folders = _load_icon("folder-library.png")
-_icon_search_emails = _load_icon("mail.png")
-_icon_search_calendar = _load_icon("calendar.png")
-_icon_read_item = _load_icon("mail-read.png")
+_icon_server = _load_icon("mcp-server")
+_icon_list_folders = _load_icon("folder-library")
+_icon_search_emails = _load_icon("mail")
+_icon_search_calendar = _load_icon("calendar")
+_icon_read_item = _load_icon("mail-read")
 
 mcp = FastMCP("Outlook", icons=[_icon_server], instructions=(
     "Search and read Outlook emails and calendar events. "
@@ -55,72 +58,205 @@ OL_FOLDER_CALENDAR = 9
 # ---------------------------------------------------------------------------
 
 def _get_namespace():
-    """Return a fresh MAPI namespace (must be called after CoInitialize)."""
-    outlook = win32com.client.Dispatch("Outlook.Application")
+    """Return a fresh MAPI namespace (must be called after CoInitialize).
+
+    Prefers the makepy-generated early-bound wrappers so property reads are
+    typed calls rather than IDispatch name lookups; the generated module is
+    cached by gencache after the first call.
+    """
+    try:
+        outlook = win32com.client.gencache.EnsureDispatch("Outlook.Application")
+    except Exception:
+        # e.g. a stale or unwritable gen_py cache — late binding still works
+        outlook = win32com.client.Dispatch("Outlook.Application")
     return outlook.GetNamespace("MAPI")
 
 
+# store display name (lower) -> [(folder name (lower), EntryID, StoreID)] for its
+# top-level folders, in Outlook's order. IDs rather than COM objects are cached
+# so entries stay valid across threads and namespace reconnects. The dict is
+# never mutated after publication: rebuilds swap in a new one under the lock, so
+# concurrent readers always see a complete snapshot.
+_folder_cache: dict[str, list[tuple[str, str, str]]] = {}
+_folder_cache_lock = threading.Lock()
+
+
+def _build_folder_cache(namespace) -> None:
+    """Rebuild _folder_cache with every store's top-level folders.
+
+    Collections are walked with their COM enumerators rather than
+    Count + Item(i), which costs two dispatches per element.
+    """
+    global _folder_cache
+    cache = {}
+    for store in namespace.Stores:
+        store_lower = store.DisplayName.lower()
+        if store_lower in cache:
+            continue  # first store with a given name wins, as in a linear scan
+        try:
+            store_id = store.StoreID  # shared by every folder in the store
+            root = store.GetRootFolder()
+            folders = [(folder.Name.lower(), folder.EntryID, store_id)
+                       for folder in root.Folders]
+        except Exception:
+            continue  # unavailable store (e.g. disconnected shared mailbox)
+        cache[store_lower] = folders
+    with _folder_cache_lock:
+        _folder_cache = cache
+
+
+def _match_cached_folder(store_lower: str, folder_lower: str) -> tuple[str, str] | None:
+    """Return (EntryID, StoreID) of the first matching folder in the first matching store."""
+    with _folder_cache_lock:
+        cache = _folder_cache
+    for name, folders in cache.items():
+        if store_lower in name:
+            for folder_name, entry_id, store_id in folders:
+                if folder_lower in folder_name:
+                    return entry_id, store_id
+            return None
+    return None
+
+
 def _find_folder_in_store(namespace, store_name: str, folder_name: str):
     """Find a folder inside a named store using case-insensitive partial match.
 
-    Returns the folder COM object, or None if the store or folder is not found.
+    Folder IDs come from _folder_cache; the cache is built on first use and
+    rebuilt at most once per call when the lookup misses, a cached ID no
+    longer resolves (folder created, moved or deleted), or the resolved
+    folder's current name no longer matches (renamed). Returns the folder COM
+    object, or None if not found.
     """
-    folder_lower = folder_name.lower()
     store_lower = store_name.lower()
+    folder_lower = folder_name.lower()
 
-    for i in range(1, namespace.Stores.Count + 1):
-        store = namespace.Stores.Item(i)
-        if store_lower in store.DisplayName.lower():
-            root = store.GetRootFolder()
-            for j in range(1, root.Folders.Count + 1):
-                folder = root.Folders.Item(j)
+    rebuilt = False
+    if not _folder_cache:
+        _build_folder_cache(namespace)
+        rebuilt = True
+
+    while True:
+        ids = _match_cached_folder(store_lower, folder_lower)
+        if ids is not None:
+            try:
+                folder = namespace.GetFolderFromID(*ids)
+            except pythoncom.com_error:
+                pass  # deleted or moved since the cache was built
+            else:
+                # A renamed folder keeps its EntryID; make sure the cached name
+                # still describes it before trusting the match
                 if folder_lower in folder.Name.lower():
                     return folder
+        if rebuilt:
             return None
-    return None
+        _build_folder_cache(namespace)  # stale cache: rebuild once and retry
+        rebuilt = True
+
+
+_com_local = threading.local()  # COM-thread state: is_com_thread, namespace
+
+
+def _init_com_thread():
+    """Executor initializer: enter the COM apartment shared by every tool call."""
+    pythoncom.CoInitialize()
+    _com_local.is_com_thread = True
+
+
+# All Outlook access runs on this one long-lived worker. FastMCP runs sync
+# tools on anyio pool threads, which exit after ~10 s idle — a per-thread
+# apartment there would be left initialized and its namespace discarded each
+# time a worker retires. The apartment lives until the process exits.
+_com_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="outlook-com",
+                                   initializer=_init_com_thread)
+
+
+def _on_com_thread(fn):
+    """Decorator: run a tool on the dedicated COM thread and wait for its result."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if getattr(_com_local, 'is_com_thread', False):
+            return fn(*args, **kwargs)  # already there; submitting would deadlock
+        return _com_executor.submit(fn, *args, **kwargs).result()
+    return wrapper
 
 
 @contextmanager
 def _com_session():
-    """CoInitialize, yield a MAPI namespace, CoUninitialize."""
-    pythoncom.CoInitialize()
-    try:
-        yield _get_namespace()
-    finally:
-        pythoncom.CoUninitialize()
+    """Yield the COM thread's MAPI namespace, connecting on first use.
+
+    Must run on the COM thread (tools use @_on_com_thread). The namespace is
+    cached and reused by later tool calls instead of re-running Dispatch
+    every time; a cached namespace that no longer answers (Outlook was closed
+    or restarted) is replaced.
+    """
+    namespace = getattr(_com_local, 'namespace', None)
+    if namespace is not None:
+        try:
+            namespace.CurrentProfileName  # cheap liveness probe
+        except pythoncom.com_error:
+            namespace = None
+    if namespace is None:
+        namespace = _com_local.namespace = _get_namespace()
+    yield namespace
 
 
 # ---------------------------------------------------------------------------
 # Text helpers
 # ---------------------------------------------------------------------------
 
+_STYLE_SCRIPT_RE = re.compile(r'<(style|script)[^>]*>.*?</\1>', re.DOTALL | re.IGNORECASE)
+_LINE_BREAK_RE = re.compile(r'<br\s*/?>|</(?:p|div|tr|li|h[1-6])>', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_MULTI_NL_RE = re.compile(r'\n{3,}')
+
+
 def strip_html(html: str) -> str:
     """Basic HTML to plain text conversion."""
     if not html:
         return ""
-    text = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<script[^>]*>.*?</script>', '', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
-    text = re.sub(r'</(p|div|tr|li|h[1-6])>', '\n', text, flags=re.IGNORECASE)
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _STYLE_SCRIPT_RE.sub('', html)
+    text = _LINE_BREAK_RE.sub('\n', text)
+    text = _TAG_RE.sub('', text)
     text = html_mod.unescape(text)
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _MULTI_NL_RE.sub('\n\n', text)
     return text.strip()
 
 
+def _format_datetime(dt) -> str:
+    """Format a COM datetime as 'YYYY-MM-DD HH:MM', or 'unknown' if unset.
+
+    isoformat is about twice as fast as strftime and, unlike strftime, is not
+    locale-aware. Slicing drops the UTC offset pywin32 attaches.
+    """
+    return dt.isoformat(' ', 'minutes')[:16] if dt else 'unknown'
+
+
 MAX_BODY_LENGTH = 50_000  # ~50k chars ≈ ~12k tokens
+MAX_HTML_LENGTH = MAX_BODY_LENGTH * 4  # headroom for markup before strip_html
 
 
 def _get_body(item, truncate: bool = True) -> str:
     """Get plain-text body, falling back to HTMLBody with strip_html."""
-    body = getattr(item, 'Body', '') or ''
+    body = item.Body or ''
+    html_truncated = False
     if not body.strip():
         html_body = getattr(item, 'HTMLBody', '') or ''
+        if truncate and len(html_body) > MAX_HTML_LENGTH:
+            # Drop <style>/<script> blocks before the cut so one can't be left
+            # unterminated (its CSS/JS would survive strip_html as text)
+            html_body = _STYLE_SCRIPT_RE.sub('', html_body)
+            if len(html_body) > MAX_HTML_LENGTH:
+                # Bound strip_html's work on huge (e.g. marketing) HTML bodies
+                html_body = html_body[:MAX_HTML_LENGTH]
+                cut_tag = html_body.rfind('<')
+                if cut_tag > html_body.rfind('>'):
+                    html_body = html_body[:cut_tag]  # don't leak a half tag as text
+                html_truncated = True
         if html_body:
             body = strip_html(html_body)
     body = body.strip()
     if truncate:
-        if len(body) > MAX_BODY_LENGTH:
+        if len(body) > MAX_BODY_LENGTH or html_truncated:
             body = body[:MAX_BODY_LENGTH] + "\n\n[body truncated — use read_item with full_body=true to get the complete text]"
         body = _shorten_urls(body)
     return body
@@ -135,7 +271,8 @@ def _clean_sender(item) -> str:
     name = getattr(item, 'SenderName', '') or ''
     email = getattr(item, 'SenderEmailAddress', '') or ''
 
-    if email.upper().startswith('/O=') or '/CN=' in email.upper():
+    email_upper = email.upper()
+    if email_upper.startswith('/O=') or '/CN=' in email_upper:
         try:
             smtp = item.Sender.GetExchangeUser().PrimarySmtpAddress
             if smtp:
@@ -154,42 +291,57 @@ def _clean_sender(item) -> str:
 # Short ID cache
 # ---------------------------------------------------------------------------
 
-_id_cache: OrderedDict[str, str] = OrderedDict()  # short_id -> real entry_id
+_id_cache: dict[str, str] = {}  # short_id -> real entry_id, oldest first
+_entry_to_short: dict[str, str] = {}  # reverse index: real entry_id -> short_id
+# Both maps are updated in multi-step read-modify-write sequences; every access
+# in the server goes through _assign_short_id/_resolve_id under this lock.
+_id_cache_lock = threading.Lock()
 MAX_CACHE_SIZE = 500
 
 
+_BASE36 = b'0123456789abcdefghijklmnopqrstuvwxyz'
+
+
 def _hash_id(entry_id: str) -> str:
-    """Convert an entry_id to a 4-char base36 hash."""
-    digest = hashlib.sha256(entry_id.encode()).digest()
-    num = int.from_bytes(digest[:4], 'big')
-    chars = '0123456789abcdefghijklmnopqrstuvwxyz'
-    result = []
-    for _ in range(4):
-        num, rem = divmod(num, 36)
-        result.append(chars[rem])
-    return ''.join(result)
+    """Convert an entry_id to a 4-char base36 hash (CRC-32; collisions are
+    handled by _assign_short_id)."""
+    num = zlib.crc32(entry_id.encode())
+    # Lowest base36 digit first, unrolled for exactly four digits
+    num, r0 = divmod(num, 36)
+    num, r1 = divmod(num, 36)
+    num, r2 = divmod(num, 36)
+    r3 = num % 36
+    return bytes((_BASE36[r0], _BASE36[r1], _BASE36[r2], _BASE36[r3])).decode('ascii')
 
 
 def _assign_short_id(entry_id: str) -> str:
     """Assign a deterministic 4-char base36 ID and cache the mapping."""
-    short = _hash_id(entry_id)
-
-    existing = _id_cache.get(short)
-    if existing and existing != entry_id:
-        for suffix in range(1, 100):
-            candidate = f"{short}{suffix}"
-            existing = _id_cache.get(candidate)
-            if not existing or existing == entry_id:
-                short = candidate
-                break
-
-    if short not in _id_cache and len(_id_cache) >= MAX_CACHE_SIZE:
-        for _ in range(len(_id_cache) // 2):
-            _id_cache.popitem(last=False)
+    with _id_cache_lock:
+        short = _entry_to_short.get(entry_id)
+        if short is not None:
+            # Already assigned — just mark it as most recently used
+            del _id_cache[short]
+            _id_cache[short] = entry_id
+            return short
+
+        if len(_id_cache) >= MAX_CACHE_SIZE:
+            for key in list(islice(_id_cache, len(_id_cache) // 2)):
+                del _entry_to_short[_id_cache.pop(key)]
+
+        short = _hash_id(entry_id)
+        if short in _id_cache:  # taken by a different entry_id
+            for suffix in range(1, 100):
+                candidate = f"{short}{suffix}"
+                if candidate not in _id_cache:
+                    short = candidate
+                    break
+            else:
+                # Every suffix taken: reclaim the base ID from its current owner
+                del _entry_to_short[_id_cache.pop(short)]
 
-    _id_cache[short] = entry_id
-    _id_cache.move_to_end(short)
-    return short
+        _id_cache[short] = entry_id
+        _entry_to_short[entry_id] = short
+        return short
 
 
 def _resolve_id(id_str: str) -> str:
@@ -199,10 +351,11 @@ def _resolve_id(id_str: str) -> str:
     the same as plain short IDs.
     """
     key = id_str[4:] if id_str.startswith("url:") else id_str
-    real_id = _id_cache.get(key)
-    if real_id is not None:
-        _id_cache.move_to_end(key)
-        return real_id
+    with _id_cache_lock:
+        real_id = _id_cache.pop(key, None)
+        if real_id is not None:
+            _id_cache[key] = real_id  # re-insert to mark as most recently used
+            return real_id
     return id_str
 
 
@@ -216,12 +369,13 @@ _URL_RE = re.compile(r'https?://\S+')
 
 def _shorten_urls(text: str) -> str:
     """Replace long URLs with [url:ID] placeholders, caching originals in _id_cache."""
+    if 'http' not in text:  # C-level substring scan; skips the regex pass entirely
+        return text
 
     def _replace(match: re.Match) -> str:
         url = match.group(0)
         # Strip trailing punctuation that's unlikely part of the URL
-        while url and url[-1] in ').,;:!?\'"':
-            url = url[:-1]
+        url = url.rstrip(').,;:!?\'"')
         if len(url) <= _URL_LENGTH_THRESHOLD:
             return match.group(0)  # leave short URLs as-is
 
@@ -238,6 +392,35 @@ def _shorten_urls(text: str) -> str:
 # ---------------------------------------------------------------------------
 
 PR_SENDER_EMAIL = "http://schemas.microsoft.com/mapi/proptag/0x0065001F"
+PR_MESSAGE_CLASS = "http://schemas.microsoft.com/mapi/proptag/0x001A001F"
+
+# Quoted DASL property references, built once rather than per filter
+_DASL_READ = '"urn:schemas:httpmail:read"'
+_DASL_DATE = '"urn:schemas:httpmail:date"'
+_DASL_MESSAGE_CLASS = f'"{PR_MESSAGE_CLASS}"'
+_DASL_SENDER_NAME = '"urn:schemas:httpmail:sendername"'
+_DASL_FROM_EMAIL = '"urn:schemas:httpmail:fromemail"'
+_DASL_DISPLAY_TO = '"urn:schemas:httpmail:displayto"'
+_DASL_SUBJECT = '"urn:schemas:httpmail:subject"'
+_DASL_TEXT = '"urn:schemas:httpmail:textdescription"'
+
+
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def _filter_date(value: str, days: int = 0) -> str:
+    """Format a YYYY-MM-DD date (shifted by `days`) as a 'MM/DD/YYYY 00:00' filter literal.
+
+    Zero-padded dates take the fast date.fromisoformat path; anything else goes
+    through strptime so the accepted input stays exactly '%Y-%m-%d' (e.g.
+    '2025-1-5' still works, '20250105' is still rejected).
+    """
+    if _ISO_DATE_RE.fullmatch(value):
+        d = date.fromisoformat(value)
+    else:
+        d = datetime.strptime(value, '%Y-%m-%d').date()
+    d += timedelta(days=days)
+    return f"{d.month:02d}/{d.day:02d}/{d.year} 00:00"
 
 
 def _build_dasl_filter(query: str, date_from: str, date_to: str,
@@ -245,49 +428,46 @@ def _build_dasl_filter(query: str, date_from: str, date_to: str,
     """Build a unified DASL filter string for Folder.GetTable().
 
     All conditions use DASL syntax so they combine in a single filter.
-    Returns an empty string if no filters are needed.
+    Always restricts to IPM.Note items so the store skips meeting requests,
+    receipts, etc. instead of returning them for client-side filtering.
+
+    Conditions are emitted cheapest/most selective first — equality, date
+    range, prefix LIKE, substring LIKE, then phrase match — so fewer rows
+    reach the expensive string matchers.
     """
     parts = []
 
+    if is_read is not None:
+        parts.append(f"{_DASL_READ} = {1 if is_read else 0}")
+
     if date_from:
-        dt = datetime.strptime(date_from, "%Y-%m-%d")
-        parts.append(
-            f"\"urn:schemas:httpmail:date\" >= '{dt.strftime('%m/%d/%Y 00:00')}'")
+        parts.append(f"{_DASL_DATE} >= '{_filter_date(date_from)}'")
     if date_to:
-        dt = datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=1)
-        parts.append(
-            f"\"urn:schemas:httpmail:date\" < '{dt.strftime('%m/%d/%Y 00:00')}'")
+        parts.append(f"{_DASL_DATE} < '{_filter_date(date_to, days=1)}'")
 
-    if query:
-        safe = query.replace("'", "''")
-        parts.append(
-            f"(\"urn:schemas:httpmail:subject\" ci_phrasematch '{safe}' "
-            f"OR \"urn:schemas:httpmail:textdescription\" ci_phrasematch '{safe}')")
+    parts.append(f"{_DASL_MESSAGE_CLASS} LIKE 'IPM.Note%'")
 
     if sender:
         words = sender.replace("'", "''").split()
         if len(words) == 1:
             w = words[0]
             parts.append(
-                f"(\"urn:schemas:httpmail:sendername\" LIKE '%{w}%' "
-                f"OR \"urn:schemas:httpmail:fromemail\" LIKE '%{w}%')")
+                f"({_DASL_SENDER_NAME} LIKE '%{w}%' OR {_DASL_FROM_EMAIL} LIKE '%{w}%')")
         else:
             # Require each word to appear in sendername independently
-            word_parts = [f"\"urn:schemas:httpmail:sendername\" LIKE '%{w}%'"
-                          for w in words]
+            word_parts = [f"{_DASL_SENDER_NAME} LIKE '%{w}%'" for w in words]
             parts.append(f"({' AND '.join(word_parts)})")
 
     if to:
         words = to.replace("'", "''").split()
-        word_parts = [f"\"urn:schemas:httpmail:displayto\" LIKE '%{w}%'"
-                      for w in words]
+        word_parts = [f"{_DASL_DISPLAY_TO} LIKE '%{w}%'" for w in words]
         parts.append(f"({' AND '.join(word_parts)})")
 
-    if is_read is not None:
-        parts.append(f"\"urn:schemas:httpmail:read\" = {1 if is_read else 0}")
+    if query:
+        safe = query.replace("'", "''")
+        parts.append(
+            f"({_DASL_SUBJECT} ci_phrasematch '{safe}' OR {_DASL_TEXT} ci_phrasematch '{safe}')")
 
-    if not parts:
-        return ""
     return "@SQL=" + " AND ".join(parts)
 
 
@@ -295,42 +475,45 @@ def _build_dasl_filter(query: str, date_from: str, date_to: str,
 # Table-based search
 # ---------------------------------------------------------------------------
 
-def _search_folder(folder, filter_str: str, max_results: int,
-                    earliest_first: bool = False) -> list[dict]:
-    """Search a folder using GetTable() and return lightweight summary dicts.
+# Columns fetched by _iter_mail_summaries; GetArray returns row values in this order.
+_MAIL_COLUMNS = ("EntryID", "Subject", "SentOn", "SenderName", PR_SENDER_EMAIL,
+                 "To", "CC")
+
+
+def _iter_table_rows(table, batch_size: int) -> Iterator[tuple]:
+    """Yield a table's rows, fetching batch_size rows per GetArray call."""
+    while not table.EndOfTable:
+        rows = table.GetArray(batch_size)
+        if not rows:
+            return
+        yield from rows
+
+
+def _iter_mail_summaries(folder, filter_str: str, batch_size: int,
+                         earliest_first: bool = False) -> Iterator[dict]:
+    """Search a folder using GetTable() and yield lightweight summary dicts.
 
     GetTable avoids loading full COM MailItem objects — it fetches only the
     requested columns directly from the store, which is significantly faster
     for listing/browsing than Items.Restrict + per-item property access.
-    """
-    if max_results <= 0:
-        return []
+    Rows are pulled in batches with GetArray so each batch is a single COM
+    call rather than one call per row and column. filter_str is expected to
+    come from _build_dasl_filter, which already excludes non-mail items.
 
-    table = folder.GetTable(filter_str or "", 0)
+    The table is opened on first iteration and read only as far as the caller
+    consumes, so callers bound it with islice.
+    """
+    table = folder.GetTable(filter_str, 0)
     table.Columns.RemoveAll()
-    table.Columns.Add("EntryID")
-    table.Columns.Add("Subject")
-    table.Columns.Add("SentOn")
-    table.Columns.Add("SenderName")
-    table.Columns.Add(PR_SENDER_EMAIL)
-    table.Columns.Add("To")
-    table.Columns.Add("CC")
-    table.Columns.Add("MessageClass")
+    for column in _MAIL_COLUMNS:
+        table.Columns.Add(column)
     table.Sort("SentOn", not earliest_first)
 
-    results = []
-    while not table.EndOfTable and len(results) < max_results:
+    for row in _iter_table_rows(table, batch_size):
         try:
-            row = table.GetNextRow()
-
-            msg_class = row("MessageClass") or ""
-            if msg_class and not msg_class.startswith("IPM.Note"):
-                continue
-
-            entry_id = row("EntryID") or ""
-            sent_on = row("SentOn")
-            sender_name = row("SenderName") or ""
-            sender_email = row(PR_SENDER_EMAIL) or ""
+            entry_id, subject, sent_on, sender_name, sender_email, to, cc = row
+            sender_name = sender_name or ""
+            sender_email = sender_email or ""
 
             # Fast sender formatting — skips Exchange DN resolution
             if (sender_email
@@ -341,22 +524,124 @@ def _search_folder(folder, filter_str: str, max_results: int,
                 sender = sender_name
 
             result = {
-                "id": _assign_short_id(entry_id),
-                "date": sent_on.strftime('%Y-%m-%d %H:%M') if sent_on else "unknown",
-                "subject": row("Subject") or "(no subject)",
+                "id": _assign_short_id(entry_id or ""),
+                "date": _format_datetime(sent_on),
+                "subject": subject or "(no subject)",
                 "sender": sender,
-                "to": row("To") or "",
+                "to": to or "",
             }
 
-            cc = row("CC") or ""
             if cc:
                 result["cc"] = cc
+        except Exception:
+            continue
+        yield result
+
+
+# ---------------------------------------------------------------------------
+# Calendar search
+# ---------------------------------------------------------------------------
+
+# Organizer name; AppointmentItem.Organizer is derived from this property
+PR_SENT_REPRESENTING_NAME = "http://schemas.microsoft.com/mapi/proptag/0x0042001F"
+
+# Columns fetched by _iter_calendar_table; GetArray returns row values in this order.
+_CALENDAR_COLUMNS = ("EntryID", "Subject", "Start", "End", "Location",
+                     PR_SENT_REPRESENTING_NAME, "ResponseStatus", "BusyStatus")
+
+
+def _calendar_summary(entry_id: str, subject: str, start, end, location: str,
+                      organizer: str, resp: int, busy: int, is_recurring: bool) -> dict:
+    """Build the search_calendar summary dict for one event or occurrence."""
+    start_str = _format_datetime(start)
+    result = {
+        "id": _assign_short_id(entry_id),
+        "date": start_str[:10] if start else 'unknown',
+        "start": start_str[11:] if start else 'unknown',
+        "end": _format_datetime(end)[11:] if end else 'unknown',
+        "subject": subject,
+        "location": location,
+        "organizer": organizer,
+        "response": RESPONSE_STATUS_MAP.get(resp, str(resp)),
+    }
+
+    if busy != 2:  # Only include if not the default "busy"
+        result["busy_status"] = BUSY_STATUS_MAP.get(busy, str(busy))
 
-            results.append(result)
+    if is_recurring:
+        result["is_recurring"] = True
+
+    return result
+
+
+def _event_sort_key(event: dict) -> tuple[str, str]:
+    return event["date"], event["start"]
+
+
+def _iter_calendar_table(folder, restrict_str: str, query_lower: str,
+                         batch_size: int, earliest_first: bool) -> Iterator[dict]:
+    """Yield non-recurring events using GetTable(), like _iter_mail_summaries.
+
+    Tables don't expand recurring series (they return only the series
+    master), so recurring events are excluded here and handled by
+    _search_calendar_occurrences.
+    """
+    table = folder.GetTable(restrict_str + " AND [IsRecurring] = False", 0)
+    table.Columns.RemoveAll()
+    for column in _CALENDAR_COLUMNS:
+        table.Columns.Add(column)
+    table.Sort("Start", not earliest_first)
+
+    for row in _iter_table_rows(table, batch_size):
+        try:
+            entry_id, subject, start, end, location, organizer, resp, busy = row
+            subject = subject or '(no subject)'
+            if query_lower and query_lower not in subject.lower():
+                continue
+            result = _calendar_summary(
+                entry_id or '', subject, start, end, location or '',
+                organizer or '', resp or 0, 2 if busy is None else busy, False)
         except Exception:
             continue
+        yield result
+
+
+def _search_calendar_occurrences(folder, restrict_str: str, query_lower: str,
+                                 max_results: int, earliest_first: bool) -> list[dict]:
+    """Search occurrences of recurring events via Items with IncludeRecurrences."""
+    # Must Sort ascending THEN IncludeRecurrences THEN Restrict — order
+    # matters for recurring event expansion (descending breaks it).
+    items = folder.Items
+    items.Sort("[Start]")
+    items.IncludeRecurrences = True
+    items = items.Restrict(restrict_str + " AND [IsRecurring] = True")
+
+    # Occurrences can only be walked ascending, so newest-first keeps a sliding
+    # window of the last max_results rows instead of summarizing every one.
+    # Summaries (and short IDs) are built only for the rows actually returned.
+    rows = [] if earliest_first else deque(maxlen=max(max_results, 0))
+    item = items.GetFirst()
+    while item and (not earliest_first or len(rows) < max_results):
+        try:
+            subject = getattr(item, 'Subject', '') or '(no subject)'
+            if not query_lower or query_lower in subject.lower():
+                rows.append((
+                    getattr(item, 'EntryID', '') or '',
+                    subject,
+                    getattr(item, 'Start', None),
+                    getattr(item, 'End', None),
+                    getattr(item, 'Location', '') or '',
+                    getattr(item, 'Organizer', '') or '',
+                    getattr(item, 'ResponseStatus', 0),
+                    getattr(item, 'BusyStatus', 2),
+                ))
+        except Exception:
+            pass
+        item = items.GetNext()
 
-    return results
+    if not earliest_first:
+        rows = reversed(rows)
+    return [_calendar_summary(*row, is_recurring=True) for row in rows]
 
 
 # ---------------------------------------------------------------------------
@@ -381,16 +666,32 @@ BUSY_STATUS_MAP = {
 }
 
 _RESPONSE_LOOKUP = {v: k for k, v in RESPONSE_STATUS_MAP.items()}
+_RESPONSE_NAMES = frozenset(_RESPONSE_LOOKUP)
+_RESPONSE_NAMES_STR = ', '.join(_RESPONSE_LOOKUP)  # for error messages
+
+
+def _get_attachment_names(item) -> list[str]:
+    """Return attachment file names, enumerating the collection once.
+
+    Iterating Attachments goes through IEnumVARIANT instead of a
+    Count + Item(i) dispatch per attachment.
+    """
+    try:
+        return [att.FileName for att in item.Attachments]
+    except Exception:
+        return []
 
 
 def _extract_mail(item, truncate: bool = True) -> dict:
     """Extract full details from a COM mail item."""
+    # Properties common to every Outlook item are read directly; getattr is
+    # kept for ones that report/receipt items (e.g. ReportItem) lack.
     sent_on = getattr(item, 'SentOn', None)
     body = _get_body(item, truncate=truncate)
 
     result = {
-        "date": sent_on.strftime('%Y-%m-%d %H:%M') if sent_on else 'unknown',
-        "subject": getattr(item, 'Subject', '(no subject)') or '(no subject)',
+        "date": _format_datetime(sent_on),
+        "subject": item.Subject or '(no subject)',
         "sender": _clean_sender(item),
         "to": getattr(item, 'To', '') or '',
         "body": body,
@@ -400,21 +701,15 @@ def _extract_mail(item, truncate: bool = True) -> dict:
     if cc:
         result["cc"] = cc
 
-    importance = getattr(item, 'Importance', 1)  # 0=Low, 1=Normal, 2=High
+    importance = item.Importance  # 0=Low, 1=Normal, 2=High
     if importance != 1:
         result["importance"] = {0: "Low", 2: "High"}.get(importance, str(importance))
 
-    categories = getattr(item, 'Categories', '') or ''
+    categories = item.Categories or ''
     if categories:
         result["categories"] = categories
 
-    attachments = []
-    try:
-        for i in range(1, item.Attachments.Count + 1):
-            att = item.Attachments.Item(i)
-            attachments.append(att.FileName)
-    except Exception:
-        pass
+    attachments = _get_attachment_names(item)
     if attachments:
         result["attachments"] = attachments
 
@@ -423,49 +718,43 @@ def _extract_mail(item, truncate: bool = True) -> dict:
 
 def _extract_calendar(item, truncate: bool = True) -> dict:
     """Extract full details from a COM AppointmentItem."""
-    start = getattr(item, 'Start', None)
-    end = getattr(item, 'End', None)
+    start = item.Start
+    end = item.End
     body = _get_body(item, truncate=truncate)
 
     result = {
-        "subject": getattr(item, 'Subject', '(no subject)') or '(no subject)',
-        "start": start.strftime('%Y-%m-%d %H:%M') if start else 'unknown',
-        "end": end.strftime('%Y-%m-%d %H:%M') if end else 'unknown',
-        "duration": getattr(item, 'Duration', 0),
-        "location": getattr(item, 'Location', '') or '',
-        "organizer": getattr(item, 'Organizer', '') or '',
+        "subject": item.Subject or '(no subject)',
+        "start": _format_datetime(start),
+        "end": _format_datetime(end),
+        "duration": item.Duration,
+        "location": item.Location or '',
+        "organizer": item.Organizer or '',
     }
 
-    required = getattr(item, 'RequiredAttendees', '') or ''
-    optional = getattr(item, 'OptionalAttendees', '') or ''
+    required = item.RequiredAttendees or ''
+    optional = item.OptionalAttendees or ''
     if required:
         result["required_attendees"] = required
     if optional:
         result["optional_attendees"] = optional
 
-    response = getattr(item, 'ResponseStatus', 0)
+    response = item.ResponseStatus
     result["response"] = RESPONSE_STATUS_MAP.get(response, str(response))
 
-    busy = getattr(item, 'BusyStatus', 2)
+    busy = item.BusyStatus
     result["busy_status"] = BUSY_STATUS_MAP.get(busy, str(busy))
 
-    if getattr(item, 'IsRecurring', False):
+    if item.IsRecurring:
         result["is_recurring"] = True
 
     if body:
         result["body"] = body
 
-    categories = getattr(item, 'Categories', '') or ''
+    categories = item.Categories or ''
     if categories:
         result["categories"] = categories
 
-    attachments = []
-    try:
-        for i in range(1, item.Attachments.Count + 1):
-            att = item.Attachments.Item(i)
-            attachments.append(att.FileName)
-    except Exception:
-        pass
+    attachments = _get_attachment_names(item)
     if attachments:
         result["attachments"] = attachments
 
@@ -477,21 +766,25 @@ def _extract_calendar(item, truncate: bool = True) -> dict:
 # ---------------------------------------------------------------------------
 
 @mcp.tool(icons=[_icon_list_folders])
+@_on_com_thread
 def list_folders() -> list[dict]:
     """List all Outlook stores and their top-level folders with item counts."""
     with _com_session() as namespace:
         result = []
-        for i in range(1, namespace.Stores.Count + 1):
-            store = namespace.Stores.Item(i)
+        for store in namespace.Stores:
             store_info = {"store_name": store.DisplayName, "folders": []}
             try:
                 root = store.GetRootFolder()
-                for j in range(1, root.Folders.Count + 1):
-                    folder = root.Folders.Item(j)
+                for folder in root.Folders:
                     try:
-                        count = folder.Items.Count
+                        # Table row count comes from store metadata without
+                        # building the Items collection
+                        count = folder.GetTable().GetRowCount()
                     except Exception:
-                        count = -1
+                        try:
+                            count = folder.Items.Count
+                        except Exception:
+                            count = -1
                     if count != 0:
                         store_info["folders"].append({
                             "name": folder.Name,
@@ -504,6 +797,7 @@ def list_folders() -> list[dict]:
 
 
 @mcp.tool(icons=[_icon_search_emails])
+@_on_com_thread
 def search_emails(
     query: str = "",
     folder: str = "",
@@ -548,11 +842,13 @@ def search_emails(
         else:
             target_folder = namespace.GetDefaultFolder(OL_FOLDER_INBOX)
 
-        results = _search_folder(target_folder, filter_str, max_results, earliest_first)
+        summaries = _iter_mail_summaries(target_folder, filter_str, max_results, earliest_first)
+        results = list(islice(summaries, max(max_results, 0)))
         return {"count": len(results), "max_results": max_results, "results": results}
 
 
 @mcp.tool(icons=[_icon_search_calendar])
+@_on_com_thread
 def search_calendar(
     date_from: str = "",
     date_to: str = "",
@@ -573,83 +869,46 @@ def search_calendar(
     """
     if date_to and not date_from:
         raise ValueError("date_from is required when date_to is specified.")
-    if response and response.lower() not in _RESPONSE_LOOKUP:
-        raise ValueError(f"Unknown response '{response}'. Use: {', '.join(_RESPONSE_LOOKUP)}")
+    if response and response.lower() not in _RESPONSE_NAMES:
+        raise ValueError(f"Unknown response '{response}'. Use: {_RESPONSE_NAMES_STR}")
 
     with _com_session() as namespace:
         folder = namespace.GetDefaultFolder(OL_FOLDER_CALENDAR)
 
         # Default to today if no date_from
         if not date_from:
-            date_from = datetime.now().strftime("%Y-%m-%d")
+            date_from = date.today().isoformat()
         if not date_to:
             date_to = date_from
 
-        start_dt = datetime.strptime(date_from, "%Y-%m-%d")
-        end_dt = datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=1)
-
-        # Must Sort ascending THEN IncludeRecurrences THEN Restrict — order
-        # matters for recurring event expansion (descending breaks it).
-        items = folder.Items
-        items.Sort("[Start]")
-        items.IncludeRecurrences = True
-
         restrict_str = (
-            f"[Start] >= '{start_dt.strftime('%m/%d/%Y 00:00')}'"
-            f" AND [Start] < '{end_dt.strftime('%m/%d/%Y 00:00')}'"
+            f"[Start] >= '{_filter_date(date_from)}'"
+            f" AND [Start] < '{_filter_date(date_to, days=1)}'"
         )
         restrict_str += " AND [MeetingStatus] <> 5 AND [MeetingStatus] <> 7"
-        items = items.Restrict(restrict_str)
-
-        results = []
-        item = items.GetFirst()
-        while item and (not earliest_first or len(results) < max_results):
-            try:
-                resp = getattr(item, 'ResponseStatus', 0)
-                if response and RESPONSE_STATUS_MAP.get(resp) != response.lower():
-                    item = items.GetNext()
-                    continue
-
-                # Filter by subject if query given
-                subject = getattr(item, 'Subject', '') or '(no subject)'
-                if query and query.lower() not in subject.lower():
-                    item = items.GetNext()
-                    continue
-
-                start = getattr(item, 'Start', None)
-                end = getattr(item, 'End', None)
-                entry_id = getattr(item, 'EntryID', '') or ''
-
-                result = {
-                    "id": _assign_short_id(entry_id),
-                    "date": start.strftime('%Y-%m-%d') if start else 'unknown',
-                    "start": start.strftime('%H:%M') if start else 'unknown',
-                    "end": end.strftime('%H:%M') if end else 'unknown',
-                    "subject": subject,
-                    "location": getattr(item, 'Location', '') or '',
-                    "organizer": getattr(item, 'Organizer', '') or '',
-                    "response": RESPONSE_STATUS_MAP.get(resp, str(resp)),
-                }
-
-                busy = getattr(item, 'BusyStatus', 2)
-                if busy != 2:  # Only include if not the default "busy"
-                    result["busy_status"] = BUSY_STATUS_MAP.get(busy, str(busy))
-
-                if getattr(item, 'IsRecurring', False):
-                    result["is_recurring"] = True
-
-                results.append(result)
-            except Exception:
-                pass
-            item = items.GetNext()
-
-        if not earliest_first:
-            results.reverse()
-        results = results[:max_results]
+        if response:
+            restrict_str += f" AND [ResponseStatus] = {_RESPONSE_LOOKUP[response.lower()]}"
+
+        # Subject stays a client-side substring check: recurrence expansion
+        # needs a Jet restriction, and Jet has no substring operator (DASL's
+        # LIKE can't be combined with it in one Restrict).
+        query_lower = query.lower()
+
+        # Single events come from a table; only recurring series pay for
+        # per-item AppointmentItem access. Both streams share the sort order,
+        # and the table is read only as far as the merge consumes it.
+        singles = _iter_calendar_table(
+            folder, restrict_str, query_lower, max_results, earliest_first)
+        occurrences = _search_calendar_occurrences(
+            folder, restrict_str, query_lower, max_results, earliest_first)
+        merged = heapq.merge(singles, occurrences, key=_event_sort_key,
+                             reverse=not earliest_first)
+        results = list(islice(merged, max(max_results, 0)))
         return {"count": len(results), "max_results": max_results, "results": results}
 
 
 @mcp.tool(icons=[_icon_read_item])
+@_on_com_thread
 def read_item(entry_id: str, full_body: bool = False) -> dict:
     """Read the full content of an email, calendar event, or URL by its ID.
 
@@ -660,12 +919,12 @@ def read_item(entry_id: str, full_body: bool = False) -> dict:
     real_id = _resolve_id(entry_id)
 
     # If the resolved value is a URL, return it directly
-    if real_id.startswith("https://") or real_id.startswith("http://"):
+    if real_id.startswith(("https://", "http://")):
         return {"url": real_id}
 
     with _com_session() as namespace:
         item = namespace.GetItemFromID(real_id)
-        msg_class = getattr(item, 'MessageClass', '') or ''
+        msg_class = item.MessageClass or ''
         if msg_class.startswith('IPM.Appointment'):
             return _extract_calendar(item, truncate=not full_body)
         return _extract_mail(item, truncate=not full_body)
@@ -18,6 +18,8 @@ from server import (
     _shorten_urls, _id_cache,
 )
 
+_URL_PLACEHOLDER_RE = re.compile(r'\[url:(\w+)\]')
+
 
 # ============================================================================
 # list_folders
@@ -142,6 +144,28 @@ def test_search_calendar_earliest_first():
                asc["results"][0]["start"] != desc["results"][-1]["start"]
 
 
+@pytest.mark.parametrize("earliest_first", [True, False])
+def test_search_calendar_merged_order(earliest_first):
+    """Single events and recurring occurrences merge into one (date, start) order."""
+    result = search_calendar(
+        date_from="2025-01-01",
+        date_to="2026-12-31",
+        earliest_first=earliest_first,
+        max_results=50,
+    )
+    assert result["count"] > 0
+    keys = [(e["date"], e["start"]) for e in result["results"]]
+    assert keys == sorted(keys, reverse=not earliest_first)
+
+    singles = [e for e in result["results"] if not e.get("is_recurring")]
+    for event in singles:
+        assert event["organizer"], f"Missing organizer on single event: {event}"
+    if singles:
+        # Table organizer column must agree with AppointmentItem.Organizer
+        full = read_item(entry_id=singles[0]["id"])
+        assert full["organizer"] == singles[0]["organizer"]
+
+
 def test_search_calendar_response_filter():
     """response='accepted' filters to only accepted events."""
     result = search_calendar(
@@ -185,7 +209,7 @@ def test_read_item_url():
     shortened = _shorten_urls(text)
 
     # Extract the [url:XXXX] placeholder
-    match = re.search(r'\[url:(\w+)\]', shortened)
+    match = _URL_PLACEHOLDER_RE.search(shortened)
     assert match, f"Expected [url:ID] placeholder in: {shortened}"
     url_id = match.group(1)
 
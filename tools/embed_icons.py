@@ -0,0 +1,35 @@
+"""
+Embed the server's PNG icons into _icons.py as base64 strings.
+
+server.py builds its icon data URIs from the generated module, so importing it
+does no file I/O. Re-run after changing any icon in images/:
+
+Usage:
+    python tools/embed_icons.py
+"""
+
+import base64
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ICONS = ["calendar", "folder-library", "mail", "mail-read", "mcp-server"]
+
+
+def main():
+    lines = [
+        "# Generated by tools/embed_icons.py from images/*.png — do not edit by hand.",
+        "",
+        "ICON_B64 = {",
+    ]
+    for name in ICONS:
+        with open(os.path.join(ROOT, "images", f"{name}.png"), "rb") as f:
+            b64 = base64.b64encode(f.read()).decode()
+        lines.append(f'    "{name}": "{b64}",')
+    lines.append("}")
+
+    with open(os.path.join(ROOT, "_icons.py"), "w", encoding="utf-8", newline="\n") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    main()